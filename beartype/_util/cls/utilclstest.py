@@ -317,6 +317,16 @@ def is_type_subclass(
         f'{repr(base_classes)} neither class nor tuple of classes.')
 
     # Return true only if...
+    #
+    # Note that this tester intentionally guards the issubclass() builtin with
+    # an isinstance() test rather than merely catching the "TypeError" raised
+    # by issubclass() when passed a non-class. Although the latter would avoid
+    # one C-level type check on the common case of a class, issubclass() does
+    # *NOT* reliably raise that exception when passed a non-class. Instead,
+    # issubclass() silently accepts any object defining a "__bases__" tuple as
+    # a pseudo-class -- including C-based type hint factories proxying that
+    # attribute to their origin types (e.g., "issubclass(list[int], object)"
+    # is true under Python >= 3.9, despite "list[int]" *NOT* being a class).
     return (
         # This object is a class *AND*...
         isinstance(cls, type) and
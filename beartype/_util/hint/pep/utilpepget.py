@@ -320,6 +320,7 @@ def get_hint_pep_sign(
     if hint_sign is None:
         # Avoid circular import dependencies.
         from beartype._util.hint.nonpep.utilnonpeptest import die_if_hint_nonpep
+        from beartype._util.hint.utilhintget import get_hint_repr
 
         # If this hint is PEP-noncompliant, raise an exception.
         die_if_hint_nonpep(
@@ -336,8 +337,13 @@ def get_hint_pep_sign(
         # Note that we intentionally avoid calling the
         # die_if_hint_pep_unsupported() function here, which calls the
         # is_hint_pep_supported() function, which calls this function.
+        #
+        # Note that the memoized get_hint_repr() getter rather than the
+        # unmemoized repr() builtin is intentionally called here. The prior
+        # call to the get_hint_pep_sign_or_none() getter already represented
+        # this hint via the former, which this call then merely reuses.
         raise exception_cls(
-            f'{exception_prefix}type hint {repr(hint)} '
+            f'{exception_prefix}type hint {get_hint_repr(hint)} '
             f'currently unsupported by beartype. '
             f'You suddenly feel encouraged to submit '
             f'a feature request for this hint to our '
@@ -803,9 +809,16 @@ def get_hint_pep_origin_type_isinstanceable(hint: object) -> type:
 
     # If this type does *NOT* exist, raise an exception.
     if hint_origin_type is None:
+        # Avoid circular import dependencies.
+        from beartype._util.hint.utilhintget import get_hint_repr
+
+        # Raise this exception, representing this hint via the memoized
+        # get_hint_repr() getter rather than the unmemoized repr() builtin. The
+        # prior call to the get_hint_pep_sign_or_none() getter typically
+        # already represented this hint via the former.
         raise BeartypeDecorHintPepException(
-            f'Type hint {repr(hint)} not isinstanceable (i.e., does not '
-            f'originate from isinstanceable class).'
+            f'Type hint {get_hint_repr(hint)} not isinstanceable '
+            f'(i.e., does not originate from isinstanceable class).'
         )
     # Else, this type exists.
 
@@ -813,6 +826,7 @@ def get_hint_pep_origin_type_isinstanceable(hint: object) -> type:
     return hint_origin_type
 
 
+@callable_cached
 def get_hint_pep_origin_type_isinstanceable_or_none(
     hint: Any) -> Optional[type]:
     '''
@@ -822,9 +836,14 @@ def get_hint_pep_origin_type_isinstanceable_or_none(
     if this hint originates from such a type *or* ``None`` otherwise (i.e., if
     this hint does *not* originate from such a type).
 
-    This getter is intentionally *not* memoized (e.g., by the
-    :func:`callable_cached` decorator), as the implementation trivially reduces
-    to an efficient one-liner.
+    This getter is memoized for efficiency. Although the implementation reduces
+    to a one-liner, that one-liner internally calls the
+    :func:`get_hint_pep_sign` getter *and* accesses the ``__origin__`` dunder
+    attribute. Since the same small set of type hints (e.g.,
+    :obj:`typing.List`, ``list[str]``) recurs across most annotations,
+    memoization reduces subsequent calls to a single dictionary lookup.
+    Unhashable type hints (e.g., ``typing.Literal[[]]``) are silently *not*
+    memoized by that decorator.
 
     Caveats
     ----------
@@ -853,8 +872,20 @@ def get_hint_pep_origin_type_isinstanceable_or_none(
         Further details.
     '''
 
-    # Sign uniquely identifying this hint.
-    hint_sign = get_hint_pep_sign(hint)
+    # Sign uniquely identifying this hint if recognized *OR* "None" otherwise.
+    #
+    # Note that this getter intentionally calls the memoized
+    # get_hint_pep_sign_or_none() getter rather than the unmemoized
+    # get_hint_pep_sign() getter wrapping that getter. The former reduces to a
+    # single dictionary lookup on the common case of a recognized hint, whereas
+    # the latter additionally pushes a stack frame merely to test for "None".
+    hint_sign = get_hint_pep_sign_or_none(hint)
+
+    # If this sign is unrecognized, defer to the get_hint_pep_sign() getter to
+    # raise the appropriate exception describing this hint.
+    if hint_sign is None:
+        get_hint_pep_sign(hint)
+    # Else, this sign is recognized.
 
     # Return either...
     return (
@@ -14,6 +14,7 @@ This private submodule is *not* intended for importation by downstream callers.
 from beartype._cave._cavefast import ModuleType
 from beartype.roar._roarexc import _BeartypeUtilModuleException
 from beartype.typing import Optional
+from beartype._util.utilobject import get_object_type_unless_type
 from inspect import findsource
 from pathlib import Path
 from sys import modules as sys_modules
@@ -243,9 +244,6 @@ def get_object_type_module_name_or_none(obj: object) -> Optional[str]:
         * ``None`` otherwise.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._util.utilobject import get_object_type_unless_type
-
     # Make it so, ensign.
     return get_object_module_name_or_none(get_object_type_unless_type(obj))
 
@@ -181,6 +181,84 @@ def get_weakref_obj_or_repr(obj_weakref: object, obj_repr: str) -> object:
         obj_repr
     )
 
+# ....................{ PICKLERS                           }....................
+def pickle_obj_weakref_and_repr(
+    obj_weakref: object, obj_repr: str) -> Tuple[bool, str]:
+    '''
+    2-tuple ``(is_none, repr)`` safely encoding the passed pair of objects for
+    pickling, where this pair is typically that returned by a prior call to the
+    companion :func:`make_obj_weakref_and_repr` function.
+
+    Weak references are unpicklable. Likewise, the private placeholder
+    substituted for weak references to the ``None`` singleton is unpicklable
+    in the sense that unpickling a pickled copy of that placeholder yields a
+    different object. This function thus replaces this weak reference with a
+    boolean preserving only whether the referent was ``None``, reversible by
+    the companion :func:`unpickle_obj_weakref_and_repr` function.
+
+    Parameters
+    ----------
+    obj_weakref : object
+        Either:
+
+        * If the referent is the ``None`` singleton, the :data:`_WEAKREF_NONE`
+          placeholder.
+        * Else if the referent supports weak references, a **weak reference**
+          (i.e., :class:`weakref.ref` instance) to that object.
+        * Else, ``None``.
+    obj_repr : str
+        Machine-readable representation of that object.
+
+    Returns
+    ----------
+    Tuple[bool, str]
+        2-tuple ``(is_none, repr)`` such that:
+
+        * ``is_none`` is :data:`True` only if the referent is ``None``.
+        * ``repr`` is the passed representation as is.
+    '''
+    assert isinstance(obj_repr, str), f'{repr(obj_repr)} not string.'
+
+    # Return this 2-tuple.
+    return (obj_weakref is _WEAKREF_NONE, obj_repr)
+
+
+def unpickle_obj_weakref_and_repr(
+    obj_is_none: bool, obj_repr: str) -> Tuple[object, str]:
+    '''
+    2-tuple ``(weakref, repr)`` decoded from the passed pair of objects
+    previously returned by a prior call to the companion
+    :func:`pickle_obj_weakref_and_repr` function, suitable for passing to the
+    :func:`get_weakref_obj_or_repr` function.
+
+    Parameters
+    ----------
+    obj_is_none : bool
+        :data:`True` only if the referent is ``None``.
+    obj_repr : str
+        Machine-readable representation of that object.
+
+    Returns
+    ----------
+    Tuple[object, str]
+        2-tuple ``(weakref, repr)`` such that:
+
+        * ``weakref`` is either:
+
+          * If the referent is ``None``, the :data:`_WEAKREF_NONE` placeholder.
+          * Else, ``None``. Since the original referent is inaccessible after
+            unpickling, the :func:`get_weakref_obj_or_repr` function then
+            returns this representation as is, exactly as if that referent had
+            already been garbage-collected.
+
+        * ``repr`` is the passed representation as is.
+    '''
+    assert isinstance(obj_is_none, bool), f'{repr(obj_is_none)} not boolean.'
+    assert isinstance(obj_repr, str), f'{repr(obj_repr)} not string.'
+
+    # Return this 2-tuple.
+    return (_WEAKREF_NONE if obj_is_none else None, obj_repr)
+
 # ....................{ PROPERTIES ~ constants             }....................
 _WEAKREF_NONE = object()
 '''
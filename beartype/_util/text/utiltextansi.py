@@ -88,8 +88,19 @@ def strip_text_ansi(text: str) -> str:
     '''
     assert isinstance(text, str), f'{repr(text)} not string.'
 
-    # Glory be to the one liner that you are about to read.
-    return _ANSI_REGEX.sub('', text)
+    # Return either...
+    return (
+        # If this text contains the escape character prefixing all ANSI escape
+        # sequences, this text stripped of all such sequences.
+        _ANSI_REGEX.sub('', text)
+        if '\033' in text else
+        # Else, this text contains *NO* such sequences. In this case, this text
+        # as is. Since most text (e.g., exception messages when colour is
+        # disabled) contains *NO* such sequences, this efficient C-based
+        # substring test avoids an inefficient regex substitution in the
+        # common case.
+        text
+    )
 
 # ....................{ PRIVATE ~ constants                }....................
 _ANSI_REGEX = re_compile(r'\033\[[0-9;?]*[A-Za-z]')
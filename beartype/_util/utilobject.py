@@ -12,28 +12,86 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype.roar._roarexc import _BeartypeUtilObjectNameException
+from beartype._cave._cavefast import CallableOrClassTypes
 from beartype.typing import (
     Any,
     Optional,
 )
-from contextlib import AbstractContextManager
 
 # ....................{ CLASSES                            }....................
 class Iota(object):
     '''
     **Iota** (i.e., object minimizing space consumption by guaranteeably
     containing *no* attributes).
+
+    Instances of this class are only comparable by identity. Callers should
+    thus *always* test instances of this class with the ``is`` operator rather
+    than the ``==`` operator.
     '''
 
     __slots__ = ()
 
+    # Explicitly bind the identity-based comparison and hashing dunder methods
+    # defined by the root "object" superclass, documenting that instances of
+    # this class are only comparable by identity. Note that "__hash__" *MUST*
+    # be bound alongside "__eq__", as Python otherwise implicitly sets
+    # "__hash__" to "None" in classes defining "__eq__" and thus renders
+    # instances of this class unhashable.
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+    __hash__ = object.__hash__
+
 # ....................{ CONSTANTS                          }....................
-SENTINEL = Iota()
+SENTINEL = object()
 '''
 Sentinel object of arbitrary value.
 
+This object is intentionally a direct instance of the root :class:`object`
+superclass rather than an instance of a user-defined class (e.g.,
+:class:`Iota`). Whereas instances of user-defined classes are tracked by the
+cyclic garbage collector (as those instances refer to their heap-allocated
+classes), direct instances of :class:`object` are *not*.
+
 This object is internally leveraged by various utility functions to identify
-erroneous and edge-case input (e.g., iterables of insufficient length).
+erroneous and edge-case input (e.g., iterables of insufficient length). Callers
+should *always* test this object with the ``is`` operator (e.g., ``if obj is
+SENTINEL:``) rather than the ``==`` operator, which needlessly defers to the
+``__eq__`` dunder method of the other operand.
+'''
+
+# ....................{ PRIVATE ~ constants                }....................
+_CONTEXT_MANAGER_METHOD_NAMES = ('__enter__', '__exit__')
+'''
+Tuple of the names of all dunder methods required by the **context manager
+protocol,** enabling the :func:`is_object_context_manager` tester to search
+the method resolution order (MRO) of types for these methods.
+'''
+
+
+_HASHABLE_TYPES = frozenset((
+    bool,
+    bytes,
+    complex,
+    float,
+    frozenset,
+    int,
+    str,
+    type,
+    type(None),
+))
+'''
+Frozen set of all **trivially hashable types** (i.e., builtin types whose
+instances are *always* hashable), enabling the :func:`is_object_hashable`
+tester to avoid both calling the :func:`hash` builtin and establishing a
+``try``-``except`` block for the common case of objects of these types.
+
+Note that this set intentionally excludes the :class:`tuple` type. Although
+most tuples are hashable, tuples containing one or more unhashable items (e.g.,
+``([],)``) are unhashable. Likewise, note that the :func:`is_object_hashable`
+tester intentionally tests exact type membership in this set rather than
+calling the :func:`isinstance` builtin. Subclasses of these types are free to
+override the ``__hash__`` dunder method to raise exceptions and are thus *not*
+trivially hashable.
 '''
 
 # ....................{ TESTERS                            }....................
@@ -54,8 +112,55 @@ def is_object_context_manager(obj: object) -> bool:
         :data:`True` only if this object is a context manager.
     '''
 
-    # One-liners for frivolous inanity.
-    return isinstance(obj, AbstractContextManager)
+    # Type of this object.
+    obj_type = type(obj)
+
+    # Note that this tester intentionally avoids the more concise
+    # "isinstance(obj, contextlib.AbstractContextManager)" test, which
+    # implicitly calls the pure-Python
+    # AbstractContextManager.__subclasshook__() dunder method on each cache miss
+    # of the "ABCMeta" metaclass, which then iteratively searches the method
+    # resolution order (MRO) of this type for these same dunder methods.
+    # Directly searching that MRO here is considerably faster. Like that dunder
+    # method, this tester treats types defining either of these methods to be
+    # "None" as explicitly opting out of this protocol. Unlike that test,
+    # however, this tester does *NOT* recognize virtual subclasses registered
+    # via the AbstractContextManager.register() method that fail to define
+    # these methods. Since the "with" statement *ONLY* calls these methods, such
+    # subclasses are *NOT* context managers anyway.
+    #
+    # Note also that these methods are searched for in the dictionaries of the
+    # classes in the MRO of the type of this object rather than via the
+    # getattr() builtin, as the "with" statement only looks up dunder methods
+    # on types. Passing this type to the getattr() builtin would erroneously
+    # also find methods defined by the metaclass of this type.
+
+    # For the name of each dunder method required by this protocol...
+    for method_name in _CONTEXT_MANAGER_METHOD_NAMES:
+        # For each class in the MRO of this type...
+        for obj_type_base in obj_type.__mro__:
+            # Dictionary mapping from the name to value of each attribute
+            # directly declared by this class.
+            obj_type_base_dict = obj_type_base.__dict__
+
+            # If this class directly declares this method...
+            if method_name in obj_type_base_dict:
+                # If this class declares this method to be "None", this class
+                # explicitly opts out of this protocol. In this case, return
+                # false.
+                if obj_type_base_dict[method_name] is None:
+                    return False
+                # Else, this class declares this method to be non-"None".
+
+                # Halt searching for this method.
+                break
+            # Else, this class does *NOT* directly declare this method.
+        # If *NO* class in this MRO declares this method, return false.
+        else:
+            return False
+
+    # Else, this type declares all of these methods. In this case, return true.
+    return True
 
 
 # Note that this tester function *CANNOT* be memoized by the @callable_cached
@@ -77,6 +182,23 @@ def is_object_hashable(obj: object) -> bool:
         :data:`True` only if this object is hashable.
     '''
 
+    # Type of this object.
+    obj_type = type(obj)
+
+    # If this object is an instance of a trivially hashable type, this object
+    # is hashable. In this case, immediately return true.
+    #
+    # Note that testing membership in this set hashes this type, which calls
+    # the __hash__() dunder method of the metaclass of this type. Since
+    # metaclasses defining __eq__() but *NOT* __hash__() are unhashable, doing
+    # so could erroneously raise an exception for an otherwise hashable object.
+    # Since all trivially hashable types share the root "type" metaclass whose
+    # hash is identity-based, first test the metaclass of this type to be that
+    # metaclass.
+    if type(obj_type) is type and obj_type in _HASHABLE_TYPES:
+        return True
+    # Else, this object is *NOT* an instance of a trivially hashable type.
+
     # Attempt to hash this object. If doing so raises *any* exception
     # whatsoever, this object is by definition unhashable.
     #
@@ -137,13 +259,6 @@ def get_object_name(obj: Any) -> str:
         dunder attributes.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._cave._cavefast import CallableOrClassTypes
-    from beartype._util.mod.utilmodget import (
-        get_object_module_name_or_none,
-        get_object_type_module_name_or_none,
-    )
-
     # Lexically scoped name of this object excluding this module name if this
     # object is named *OR* raise an exception otherwise.
     object_scopes_name = get_object_basename_scoped(obj)
@@ -154,10 +269,17 @@ def get_object_name(obj: Any) -> str:
     #   of the module declaring this object.
     # * Else, the fully-qualified name of the module declaring the class of
     #   this object.
-    object_module_name = (
-        get_object_module_name_or_none(obj)
-        if isinstance(object, CallableOrClassTypes) else
-        get_object_type_module_name_or_none(obj)
+    #
+    # Note that this getter intentionally inlines the
+    # get_object_module_name_or_none() and
+    # get_object_type_module_name_or_none() getters defined by the
+    # "beartype._util.mod.utilmodget" submodule, each of which trivially
+    # reduces to this same attribute lookup. Doing so avoids both an
+    # additional stack frame *AND* an additional deferred import per call.
+    object_module_name = getattr(
+        obj if isinstance(obj, CallableOrClassTypes) else type(obj),
+        '__module__',
+        None,
     )
 
     # Return either...
@@ -360,7 +482,10 @@ def get_object_type_basename(obj: object) -> str:
     '''
 
     # Elegant simplicity diminishes aggressive tendencies.
-    return get_object_type_unless_type(obj).__name__
+    #
+    # Note that this getter intentionally inlines the trivial
+    # get_object_type_unless_type() getter to avoid an additional stack frame.
+    return (obj if isinstance(obj, type) else type(obj)).__name__
 
 
 def get_object_type_name(obj: object) -> str:
@@ -380,19 +505,22 @@ def get_object_type_name(obj: object) -> str:
         Fully-qualified name of the type of this object.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._util.mod.utilmodget import (
-        get_object_type_module_name_or_none)
-
     # Type of this object.
-    cls = get_object_type_unless_type(obj)
+    #
+    # Note that this getter intentionally inlines the lower-level
+    # get_object_type_basename(), get_object_type_unless_type(), and
+    # get_object_type_module_name_or_none() getters, each of which trivially
+    # reduces to an attribute lookup on this type. Calling those getters would
+    # needlessly push three stack frames and redundantly test whether this
+    # object is a type twice per call.
+    cls = obj if isinstance(obj, type) else type(obj)
 
     # Unqualified name of this type.
-    cls_basename = get_object_type_basename(cls)
+    cls_basename = cls.__name__
 
     # Fully-qualified name of the module defining this class if this class is
     # defined by a module *OR* "None" otherwise.
-    cls_module_name = get_object_type_module_name_or_none(cls)
+    cls_module_name = getattr(cls, '__module__', None)
 
     # Return either...
     return (
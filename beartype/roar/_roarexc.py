@@ -19,13 +19,29 @@ This private submodule is *not* intended for importation by downstream callers.
 # names (e.g., "from argparse import ArgumentParser as _ArgumentParser" rather
 # than merely "from argparse import ArgumentParser").
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
-from abc import ABCMeta as _ABCMeta
+from copyreg import __newobj__ as _copyreg_newobj
+
+# ....................{ PRIVATE ~ constants                }....................
+_ROAR_MODULE_NAME = 'beartype.roar'
+'''
+Fully-qualified name of the public subpackage publishing all public beartype
+exceptions, to which the fully-qualified module names of all exception classes
+declared by this private submodule are sanitized.
+'''
 
 # ....................{ SUPERCLASS                         }....................
-class BeartypeException(Exception, metaclass=_ABCMeta):
+class BeartypeException(Exception):
     '''
     Abstract base class of all **beartype exceptions.**
 
+    This class is only abstract in the documentary sense. This class is
+    intentionally *not* declared with the :class:`abc.ABCMeta` metaclass, as
+    no subclass defines abstract methods, registers virtual subclasses, or
+    overrides the ``__subclasshook__()`` dunder method. Doing so would thus
+    only needlessly slow both instantiation of and :func:`isinstance` and
+    :func:`issubclass` checks against subclasses of this class (e.g., in
+    ``except`` clauses catching beartype exceptions).
+
     Instances of subclasses of this exception are raised either:
 
     * At decoration time from the :func:`beartype.beartype` decorator.
@@ -34,33 +50,85 @@ class BeartypeException(Exception, metaclass=_ABCMeta):
     '''
 
     # ..................{ INITIALIZERS                       }..................
-    def __init__(self, message: str) -> None:
+    def __init_subclass__(cls, **kwargs) -> None:
         '''
-        Initialize this exception.
+        Initialize the passed subclass of this exception.
 
-        This constructor (in order):
+        This class method (in order):
 
-        #. Passes all passed arguments as is to the superclass constructor.
-        #. Sanitizes the fully-qualified module name of this
-           exception from the private ``"beartype.roar._roarexc"`` submodule to
-           the public ``"beartype.roar"`` subpackage to both improve the
-           readability of exception messages and discourage end users from
-           accessing this private submodule. By default, Python emits less
-           readable and dangerous exception messages resembling:
+        #. Passes all passed keyword arguments as is to the superclass method.
+        #. If this subclass is both public (i.e., its unqualified name is *not*
+           prefixed by an underscore) and declared by this private submodule,
+           sanitizes the fully-qualified module name of this subclass from the
+           private ``"beartype.roar._roarexc"`` submodule to the public
+           ``"beartype.roar"`` subpackage to both improve the readability of
+           exception messages and discourage end users from accessing this
+           private submodule. By default, Python emits less readable and
+           dangerous exception messages resembling:
 
                beartype.roar._roarexc.BeartypeCallHintParamViolation:
                @beartyped quote_wiggum_safer() parameter lines=[] violates type
                hint typing.Annotated[list[str], Is[lambda lst: bool(lst)]], as
                value [] violates validator Is[lambda lst: bool(lst)].
+
+        Sanitization is intentionally performed exactly once per subclass at
+        class creation time rather than on each instantiation of that subclass
+        (e.g., by a custom ``__init__`` method). Since exceptions are
+        instantiated far more frequently than declared, doing so avoids
+        redundantly rewriting the same class attribute on each raise. Likewise,
+        subclasses declared by third-party modules are intentionally preserved
+        as is.
+
+        Private subclasses are also intentionally preserved as is. Since the
+        public :mod:`beartype.roar` subpackage only publishes public
+        exceptions, sanitizing the module names of private exceptions would
+        prevent the :mod:`pickle` module from finding those exceptions by name
+        and thus from pickling instances of those exceptions (e.g., across
+        :mod:`multiprocessing` boundaries).
+
+        Parameters
+        ----------
+        kwargs : dict
+            Keyword arguments to be passed to the superclass method.
+        '''
+
+        # Defer to the superclass method.
+        super().__init_subclass__(**kwargs)
+
+        # If this subclass is both public and declared by this private
+        # submodule, sanitize the fully-qualified module name of this subclass.
+        # See above.
+        if cls.__module__ == __name__ and cls.__name__[0] != '_':
+            cls.__module__ = _ROAR_MODULE_NAME
+        # Else, this subclass is either private or declared by another module.
+        # Preserve the fully-qualified module name of this subclass as is.
+
+
+    def __init__(self, message: str) -> None:
+        '''
+        Initialize this exception.
+
+        This constructor is intentionally preserved despite merely deferring to
+        the superclass constructor. Why? Backward compatibility. Callers
+        (including both third-party subclasses of this exception and
+        third-party code instantiating this exception) are free to pass this
+        message as a keyword argument (e.g.,
+        ``super().__init__(message=message)``), which the C-based
+        :meth:`BaseException.__init__` method prohibits.
+
+        Parameters
+        ----------
+        message : str
+            Human-readable message describing this exception.
         '''
 
         # Defer to the superclass constructor.
         super().__init__(message)
 
-        # Sanitize the fully-qualified module name of the class of this
-        # exception. See the docstring for justification.
-        self.__class__.__module__ = 'beartype.roar'
-        # print(f'{self.__class__.__name__}: {message}')
+
+# Sanitize the fully-qualified module name of this root exception, which the
+# BeartypeException.__init_subclass__() method only sanitizes for subclasses.
+BeartypeException.__module__ = _ROAR_MODULE_NAME
 
 # ....................{ DECORATOR                          }....................
 class BeartypeDecorException(BeartypeException):
@@ -546,6 +614,88 @@ class BeartypeCallHintViolation(BeartypeCallHintException):
             for culprit in culprits
         )
 
+    # ..................{ DUNDERS                            }..................
+    def __reduce__(self) -> tuple:
+        '''
+        3-tuple ``(func, args, state)`` enabling the :mod:`pickle` module to
+        pickle this type-checking exception.
+
+        The default :meth:`BaseException.__reduce__` method reconstructs
+        exceptions by passing only the :attr:`args` tuple (i.e., the 1-tuple
+        ``(message,)``) to the :meth:`__init__` method, which additionally
+        requires culprits. Since weak references are unpicklable, this method
+        instead pickles only the machine-readable representations of these
+        culprits *and* whether each culprit is ``None``. The :meth:`culprits`
+        property of the reconstructed exception thus provides ``None`` for
+        each ``None`` culprit and these representations for all other culprits,
+        exactly as if those other culprits had already been garbage-collected.
+
+        The reconstructed exception is intentionally created *without* calling
+        the :meth:`__init__` method, which would otherwise needlessly
+        recompute weak references to and representations of culprits that the
+        :meth:`__setstate__` method then immediately replaces.
+
+        Returns
+        ----------
+        tuple
+            3-tuple ``(func, args, state)`` where:
+
+            * ``func`` is the :func:`copyreg.__newobj__` function, which
+              creates a new instance of this exception type by calling only
+              the :meth:`BaseException.__new__` method.
+            * ``args`` is the 2-tuple ``(cls, message)``, where ``cls`` is the
+              type of this exception.
+            * ``state`` is the dictionary of all instance variables of this
+              exception (e.g., ``__notes__`` added by the
+              :meth:`BaseException.add_note` method), subsequently restored by
+              the :meth:`__setstate__` method.
+        '''
+
+        # Avoid circular import dependencies.
+        from beartype._util.py.utilpyweakref import pickle_obj_weakref_and_repr
+
+        # Dictionary of all instance variables of this exception, replacing the
+        # unpicklable weak references to these culprits with picklable 2-tuples
+        # "(culprit_is_none, culprit_repr)".
+        state = self.__dict__.copy()
+        state['_culprits_weakref_and_repr'] = tuple(
+            pickle_obj_weakref_and_repr(culprit_weakref, culprit_repr)
+            for culprit_weakref, culprit_repr in (
+                self._culprits_weakref_and_repr)
+        )
+
+        # Return this 3-tuple.
+        return (_copyreg_newobj, (self.__class__, *self.args), state)
+
+
+    def __setstate__(self, state: dict) -> None:
+        '''
+        Restore this type-checking exception from the passed dictionary
+        previously returned as the ``state`` item of the 3-tuple returned by
+        the :meth:`__reduce__` method.
+
+        Parameters
+        ----------
+        state : dict
+            Dictionary of all instance variables of this exception.
+        '''
+
+        # Avoid circular import dependencies.
+        from beartype._util.py.utilpyweakref import (
+            unpickle_obj_weakref_and_repr)
+
+        # Replace each picklable 2-tuple "(culprit_is_none, culprit_repr)"
+        # pickled by the __reduce__() method with the 2-tuple
+        # "(culprit_weakref, culprit_repr)" expected by the culprits() property.
+        state['_culprits_weakref_and_repr'] = tuple(
+            unpickle_obj_weakref_and_repr(culprit_is_none, culprit_repr)
+            for culprit_is_none, culprit_repr in (
+                state['_culprits_weakref_and_repr'])
+        )
+
+        # Defer to the superclass method.
+        super().__setstate__(state)
+
     # ..................{ PROPERTIES                         }..................
     # Read-only properties intentionally providing no corresponding setters.
 
@@ -72,6 +72,14 @@ def test_is_type_subclass() -> None:
     assert is_type_subclass(
         "Thou many-colour'd, many-voiced vale,", str) is False
 
+    # Non-class masquerading as a class by defining a "__bases__" tuple, which
+    # the issubclass() builtin silently accepts as a pseudo-class.
+    class OverWhoseIceOutreached(object):
+        __bases__ = (str,)
+
+    # Assert this tester rejects non-classes masquerading as classes.
+    assert is_type_subclass(OverWhoseIceOutreached(), str) is False
+
 # ....................{ TESTS ~ tester : builtin           }....................
 def test_is_type_builtin() -> None:
     '''
@@ -121,6 +121,54 @@ def test_get_weakref_obj_or_repr() -> None:
         get_weakref_obj_or_repr(
             'Rapid and strong, but silently!', '"Its home"')
 
+
+def test_pickle_obj_weakref_and_repr() -> None:
+    '''
+    Test both the
+    :func:`beartype._util.py.utilpyweakref.pickle_obj_weakref_and_repr` and
+    :func:`beartype._util.py.utilpyweakref.unpickle_obj_weakref_and_repr`
+    functions.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype._util.py.utilpyweakref import (
+        get_weakref_obj_or_repr,
+        make_obj_weakref_and_repr,
+        pickle_obj_weakref_and_repr,
+        unpickle_obj_weakref_and_repr,
+    )
+    from pickle import (
+        dumps,
+        loads,
+    )
+
+    # ....................{ PASS                           }....................
+    # For each object that either can or cannot be weakly referenced...
+    for obj in (None, _IN_THESE_SOLITUDES, _WINDS_CONTEND, _ITS_HOME):
+        # Weak reference to and representation of this object.
+        obj_weakref, obj_repr = make_obj_weakref_and_repr(obj)
+
+        # Picklable encoding of this pair, round-tripped through pickling.
+        obj_is_none, obj_repr_pickled = loads(dumps(
+            pickle_obj_weakref_and_repr(obj_weakref, obj_repr)))
+
+        # Assert this encoding preserves whether this object is "None" and
+        # this representation as is.
+        assert obj_is_none is (obj is None)
+        assert obj_repr_pickled == obj_repr
+
+        # Object or representation accessed via the decoding of this encoding.
+        obj_new = get_weakref_obj_or_repr(
+            *unpickle_obj_weakref_and_repr(obj_is_none, obj_repr_pickled))
+
+        # Assert this decoding provides "None" if this object is "None" *OR*
+        # this representation otherwise.
+        if obj is None:
+            assert obj_new is None
+        else:
+            assert obj_new == obj_repr
+
 # ....................{ PRIVATE ~ classes                  }....................
 class _TheVoicelessLightning(object):
     '''
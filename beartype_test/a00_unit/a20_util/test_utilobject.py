@@ -17,6 +17,63 @@ This submodule unit tests the public API of the private
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
 # ....................{ TESTS ~ tester                     }....................
+def test_is_object_context_manager() -> None:
+    '''
+    Test the :func:`beartype._util.utilobject.is_object_context_manager`
+    tester.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.utilobject import is_object_context_manager
+    from beartype_test._util.pytcontext import noop_context_manager
+
+    # Class defining both dunder methods required by the context manager
+    # protocol.
+    class TheWindsOfHeaven:
+        def __enter__(self) -> 'TheWindsOfHeaven':
+            return self
+
+        def __exit__(self, *args) -> None:
+            pass
+
+    # Subclass of that class explicitly opting out of that protocol.
+    class MixWithASullenSound(TheWindsOfHeaven):
+        __enter__ = None
+
+    # Class defining only one of these dunder methods.
+    class ByTheBlueMoon(object):
+        def __enter__(self) -> 'ByTheBlueMoon':
+            return self
+
+    # Metaclass defining both dunder methods required by the context manager
+    # protocol.
+    class WithAStrangeSpell(type):
+        __enter__ = __exit__ = lambda *args: None
+
+    # Class whose metaclass rather than itself defines these dunder methods.
+    class OfTheWideWilderness(metaclass=WithAStrangeSpell):
+        pass
+
+    # Assert this tester accepts context managers.
+    assert is_object_context_manager(TheWindsOfHeaven()) is True
+    assert is_object_context_manager(noop_context_manager(None)) is True
+
+    # Assert this tester rejects objects that are not context managers,
+    # including objects explicitly opting out of that protocol.
+    assert is_object_context_manager(MixWithASullenSound()) is False
+    assert is_object_context_manager(ByTheBlueMoon()) is False
+    assert is_object_context_manager(OfTheWideWilderness()) is False
+    assert is_object_context_manager(
+        'The winds of heaven mix for ever') is False
+
+    # Assert this tester inspects the types of objects rather than objects
+    # themselves, as the "with" statement only looks up dunder methods on
+    # types.
+    with_all_its_sweet = ByTheBlueMoon()
+    with_all_its_sweet.__exit__ = lambda *args: None
+    assert is_object_context_manager(with_all_its_sweet) is False
+
+
 def test_is_object_hashable() -> None:
     '''
     Test the :func:`beartype._util.utilobject.is_object_hashable` tester.
@@ -35,6 +92,18 @@ def test_is_object_hashable() -> None:
     for object_unhashable in NOT_HINTS_UNHASHABLE:
         assert is_object_hashable(object_unhashable) is False
 
+    # Unhashable metaclass defining __eq__() but *NOT* __hash__().
+    class WhoseWaveringWills(type):
+        __eq__ = lambda cls, other: cls is other
+
+    # Class whose metaclass is unhashable.
+    class ThatDoubleDoom(metaclass=WhoseWaveringWills):
+        pass
+
+    # Assert this tester accepts hashable instances of classes whose
+    # metaclasses are unhashable *WITHOUT* raising an exception.
+    assert is_object_hashable(ThatDoubleDoom()) is True
+
 # ....................{ TESTS ~ getter                     }....................
 def test_get_object_basename_scoped() -> None:
     '''
@@ -116,10 +185,23 @@ def test_get_object_name() -> None:
 
         return and_one_majestic_river
 
+    class RollsItsLoudWaters(object):
+        '''
+        Arbitrary class.
+        '''
+
+        pass
+
     # Function partial of the above function.
     breath_and_blood = partial(
         meet_in_the_vale, 'The breath and blood of distant lands, for ever')
 
+    # Arbitrary instance of the above class, manually named and declaring a
+    # module name differing from that of the module declaring that class.
+    to_the_ocean_waves = RollsItsLoudWaters()
+    to_the_ocean_waves.__name__ = 'to_the_ocean_waves'
+    to_the_ocean_waves.__module__ = 'the_lone_stream'
+
     # ....................{ PASS                           }....................
     # Assert this getter returns the expected name for this function partial.
     assert get_object_name(meet_in_the_vale) == (
@@ -127,6 +209,18 @@ def test_get_object_name() -> None:
         'test_get_object_name.meet_in_the_vale'
     )
 
+    # Assert this getter returns the expected name for this class.
+    assert get_object_name(RollsItsLoudWaters) == (
+        'beartype_test.a00_unit.a20_util.test_utilobject.'
+        'test_get_object_name.RollsItsLoudWaters'
+    )
+
+    # Assert this getter returns the expected name for an object that is
+    # neither a callable nor class, prefixed by the name of the module declaring
+    # the class of that object.
+    assert get_object_name(to_the_ocean_waves) == (
+        'beartype_test.a00_unit.a20_util.test_utilobject.to_the_ocean_waves')
+
     # ....................{ FAIL                           }....................
     # Assert this getter raises "AttributeError" exceptions when passed objects
     # declaring neither "__qualname__" nor "__name__" dunder attributes.
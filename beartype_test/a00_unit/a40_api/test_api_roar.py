@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2023 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype exception API unit tests.**
+
+This submodule unit tests the public API of the :mod:`beartype.roar`
+subpackage.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                             }....................
+def test_api_roar_exception_module() -> None:
+    '''
+    Test that all public exception classes published by the
+    :mod:`beartype.roar` subpackage declare the public ``"beartype.roar"``
+    subpackage rather than the private ``"beartype.roar._roarexc"`` submodule
+    to be their module *before* being instantiated.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import roar
+    from beartype.roar import (
+        BeartypeDecorHintPepException,
+        BeartypeException,
+    )
+
+    # For the name and value of each public attribute of this subpackage...
+    for roar_attr_name, roar_attr in vars(roar).items():
+        # If this attribute is a beartype-specific exception class, assert this
+        # class to declare this subpackage to be its module.
+        if (
+            isinstance(roar_attr, type) and
+            issubclass(roar_attr, BeartypeException)
+        ):
+            assert roar_attr.__module__ == 'beartype.roar'
+
+    # Arbitrary third-party subclass of a beartype-specific exception class.
+    class ThatInTheVestibule(BeartypeDecorHintPepException):
+        pass
+
+    # Assert that third-party subclasses of beartype-specific exception classes
+    # preserve their modules as is, even after being instantiated.
+    ThatInTheVestibule('Of the bright chamber, where the Poet lay,')
+    assert ThatInTheVestibule.__module__ == __name__
+
+
+def test_api_roar_exception_init() -> None:
+    '''
+    Test that beartype-specific exceptions (including third-party subclasses of
+    those exceptions) accept their messages as either positional or keyword
+    arguments.
+    '''
+
+    # Defer test-specific imports.
+    from beartype.roar import BeartypeDecorHintPepException
+
+    # Arbitrary third-party subclass of a beartype-specific exception class
+    # passing its message to the superclass constructor as a keyword argument.
+    class HisHandUnstrung(BeartypeDecorHintPepException):
+        def __init__(self, message: str) -> None:
+            super().__init__(message=message)
+
+    # For each such exception class...
+    for exception_type in (BeartypeDecorHintPepException, HisHandUnstrung):
+        # Assert this class accepts its message as a positional argument.
+        exception = exception_type('His sinuous limbs, and his harp unstrung.')
+        assert exception.args == ('His sinuous limbs, and his harp unstrung.',)
+
+        # Assert this class accepts its message as a keyword argument.
+        exception = exception_type(message='Youth of the lonely lake.')
+        assert exception.args == ('Youth of the lonely lake.',)
+
+
+def test_api_roar_exception_pickle() -> None:
+    '''
+    Test that both public and private beartype-specific exceptions (including
+    type-checking violations weakly referring to their culprits) are picklable.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import (
+        BeartypeCallHintParamViolation,
+        BeartypeDecorHintPepException,
+    )
+    from beartype.roar._roarexc import _BeartypeUtilCallableException
+    from pickle import (
+        dumps,
+        loads,
+    )
+    from pytest import raises
+
+    # Assert that private exceptions preserve their private module, without
+    # which these exceptions would be unpicklable.
+    assert _BeartypeUtilCallableException.__module__ == (
+        'beartype.roar._roarexc')
+
+    # For each public and private exception class...
+    for exception_type in (
+        BeartypeDecorHintPepException, _BeartypeUtilCallableException):
+        # Instance of this exception.
+        exception = exception_type('A lovely youth,--no mourning maiden decked')
+
+        # Assert that unpickling a pickled instance of this exception reproduces
+        # the same exception type and message.
+        exception_unpickled = loads(dumps(exception))
+        assert type(exception_unpickled) is exception_type
+        assert exception_unpickled.args == exception.args
+
+    # Arbitrary class whose instances are weakly referenceable.
+    class TheSilentFlood:
+        def __repr__(self) -> str:
+            return '<TheSilentFlood>'
+
+    # Callable accepting only integers.
+    @beartype
+    def with_weeping_flowers(or_votive_cypress_wreath: int) -> int:
+        return or_votive_cypress_wreath
+
+    # Weakly referenceable culprit, preserved as a local to prevent this
+    # culprit from being garbage-collected before being pickled.
+    of_stream_and_sea = TheSilentFlood()
+
+    # For each culprit violating this callable and the expected culprit of the
+    # unpickled violation, including culprits that are:
+    # * Strings, which *CANNOT* be weakly referenced.
+    # * Weakly referenceable.
+    # * "None", which is substituted by a private placeholder.
+    for pith, culprit_unpickled in (
+        (
+            'The lone couch of his everlasting sleep:--',
+            repr('The lone couch of his everlasting sleep:--'),
+        ),
+        (of_stream_and_sea, '<TheSilentFlood>'),
+        (None, None),
+    ):
+        # Assert that calling this callable with this culprit raises a
+        # violation.
+        with raises(BeartypeCallHintParamViolation) as exception_info:
+            with_weeping_flowers(pith)
+
+        # Violation raised by this call.
+        violation = exception_info.value
+
+        # Assert that unpickling a pickled instance of this violation
+        # reproduces the same violation type and message, replacing this
+        # culprit with its representation *UNLESS* this culprit is "None".
+        violation_unpickled = loads(dumps(violation))
+        assert type(violation_unpickled) is BeartypeCallHintParamViolation
+        assert str(violation_unpickled) == str(violation)
+        assert violation_unpickled.culprits == (culprit_unpickled,)
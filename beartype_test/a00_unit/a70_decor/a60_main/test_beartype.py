@@ -63,6 +63,11 @@ def test_beartype() -> None:
     # from pytest import deprecated_call
     from re import search
 
+    # ....................{ LOCALS                         }....................
+    # @beartype-generated wrapper function type-checking the undecorated
+    # callable annotated by the currently iterated hint.
+    func_typed = None
+
     # ....................{ MAIN                           }....................
     # For each predefined type hint and associated metadata...
     for hint_pith_meta in iter_hints_piths_meta():
@@ -80,57 +85,67 @@ def test_beartype() -> None:
         pith_meta = hint_pith_meta.pith_meta
         # print(f'Type-checking PEP type hint {repr(hint_meta.hint)}...')
 
-        # Beartype decorator configured specifically for this hint.
-        beartype_confed = beartype(conf=hint_meta.conf)
-
-        # Undecorated callable both accepting a single parameter and returning
-        # a value annotated by this hint whose implementation trivially reduces
-        # to the identity function.
-        def func_untyped(hint_param: hint) -> hint:
-            return hint_param
-
-        # @beartype-generated wrapper function type-checking this callable.
-        func_typed = None
-
-        # If...
-        if (
-            # This hint is PEP-compliant (rather than PEP-noncompliant) *AND*...
-            isinstance(hint_meta, HintPepMetadata) and
-            # This hint is deprecated (e.g., by PEP 585)...
-            is_hint_pep_deprecated(hint)
-        ):
-            #FIXME: For unknown and probably uninteresting reasons, the
-            #pytest.warns() context manager appears to be broken on our
-            #local machine. We have no recourse but to unconditionally
-            #ignore this warning at the module level. So much rage!
-            #FIXME: It's likely this has something to do with the fact that
-            #Python filters deprecation warnings by default. This is almost
-            #certainly a pytest issue. Since this has become fairly
-            #unctuous, we should probably submit a pytest issue report.
-            #FIXME: Actually, pytest now appears to have explicit support for
-            #testing that a code block emits a deprecation warning:
-            #    with pytest.deprecated_call():
-            #        myfunction(17)
-            #See also: https://docs.pytest.org/en/6.2.x/warnings.html#ensuring-code-triggers-a-deprecation-warning
-            #FIXME: Fascinatingly, warns() still refuses to capture warnings.
-            #Although we certainly could call deprecated_call(), doing so is
-            #stymied by the fact that
-            #"BeartypeDecorHintPep585DeprecationWarning" does *NOT* subclass the
-            #standard "DeprecationWarning" class. *sigh*
-            func_typed = beartype_confed(func_untyped)
-
-            #FIXME: Pass the "match" parameter to deprecated_call() to assert
-            #that @beartype emits the expected deprecation warning.
-            # Decorate thes callable under a context manager asserting this
-            # declaration to emit non-fatal deprecation warnings.
-            # with warns(BeartypeDecorHintPep585DeprecationWarning):
-            # with warns():
-            # with deprecated_call():
-            #     func_typed = beartype_confed(func_untyped)
-        # Else, this is *NOT* a deprecated PEP-compliant type hint. In this
-        # case, decorated this callable as is.
-        else:
-            func_typed = beartype_confed(func_untyped)
+        # If this pith is the first pith of the current pass over all piths of
+        # this hint, decorate a new callable annotated by this hint. Since all
+        # piths of this hint are type-checked by the same hint, doing so
+        # amortizes the cost of decoration (i.e., code generation) across all
+        # of these piths. Since the iter_hints_piths_meta() generator iterates
+        # over these piths twice, this still exercises memoization across
+        # repeated @beartype decorations on different callables annotated by
+        # the same hints.
+        if pith_meta is hint_meta.piths_meta[0]:
+            # Beartype decorator configured specifically for this hint.
+            beartype_confed = beartype(conf=hint_meta.conf)
+
+            # Undecorated callable both accepting a single parameter and
+            # returning a value annotated by this hint whose implementation
+            # trivially reduces to the identity function.
+            def func_untyped(hint_param: hint) -> hint:
+                return hint_param
+
+            # If...
+            if (
+                # This hint is PEP-compliant (rather than PEP-noncompliant)
+                # *AND*...
+                isinstance(hint_meta, HintPepMetadata) and
+                # This hint is deprecated (e.g., by PEP 585)...
+                is_hint_pep_deprecated(hint)
+            ):
+                #FIXME: For unknown and probably uninteresting reasons, the
+                #pytest.warns() context manager appears to be broken on our
+                #local machine. We have no recourse but to unconditionally
+                #ignore this warning at the module level. So much rage!
+                #FIXME: It's likely this has something to do with the fact
+                #that Python filters deprecation warnings by default. This is
+                #almost certainly a pytest issue. Since this has become fairly
+                #unctuous, we should probably submit a pytest issue report.
+                #FIXME: Actually, pytest now appears to have explicit support
+                #for testing that a code block emits a deprecation warning:
+                #    with pytest.deprecated_call():
+                #        myfunction(17)
+                #See also: https://docs.pytest.org/en/6.2.x/warnings.html#ensuring-code-triggers-a-deprecation-warning
+                #FIXME: Fascinatingly, warns() still refuses to capture
+                #warnings. Although we certainly could call deprecated_call(),
+                #doing so is stymied by the fact that
+                #"BeartypeDecorHintPep585DeprecationWarning" does *NOT*
+                #subclass the standard "DeprecationWarning" class. *sigh*
+                func_typed = beartype_confed(func_untyped)
+
+                #FIXME: Pass the "match" parameter to deprecated_call() to
+                #assert that @beartype emits the expected deprecation warning.
+                # Decorate thes callable under a context manager asserting this
+                # declaration to emit non-fatal deprecation warnings.
+                # with warns(BeartypeDecorHintPep585DeprecationWarning):
+                # with warns():
+                # with deprecated_call():
+                #     func_typed = beartype_confed(func_untyped)
+            # Else, this is *NOT* a deprecated PEP-compliant type hint. In this
+            # case, decorated this callable as is.
+            else:
+                func_typed = beartype_confed(func_untyped)
+        # Else, this pith is *NOT* the first pith of the current pass over all
+        # piths of this hint. In this case, reuse the wrapper function
+        # previously decorated for the first pith of this pass.
 
         # # @beartype-generated wrapper function type-checking this callable.
         # func_typed = (func_untyped)